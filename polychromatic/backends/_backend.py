@@ -16,7 +16,6 @@ https://docs.polychromatic.app/
 """
 
 from ..fx import FX
-import glob
 import os
 import grp
 
@@ -152,6 +151,14 @@ class Backend(BackendBase):
         """
         return []
 
+    def _attach_self_to_devices(self, device_list):
+        """
+        Assign this backend to each device object's 'backend' variable, so
+        interfaces can find their way back to the owning backend.
+        """
+        for device in device_list:
+            device.backend = self
+
     #####################################################################
     class DeviceItem(object):
         """
@@ -360,6 +367,11 @@ class Backend(BackendBase):
         use one of the child classes below. These tell Polychromatic how to
         present them, the parameters (if any) and the function to execute.
         """
+        # Many option objects are created per device, so avoid allocating a
+        # per-instance __dict__. Subclasses declare slots for their own attributes.
+        __slots__ = ("uid", "label", "icon", "active", "parameters",
+                     "colours_required", "colours")
+
         def __init__(self):
             # Internal to identify this option later.
             self.uid = ""
@@ -457,6 +469,8 @@ class Backend(BackendBase):
         Parameters: Optional
         Colours: Optional
         """
+        __slots__ = ()
+
         def __init__(self):
             super().__init__()
 
@@ -467,6 +481,9 @@ class Backend(BackendBase):
         Parameters: Ignored
         Colours: Ignored
         """
+        __slots__ = ("label_enable", "label_disable", "label_toggle",
+                     "icon_enable", "icon_disable")
+
         def __init__(self):
             super().__init__()
 
@@ -492,6 +509,8 @@ class Backend(BackendBase):
         Parameters: Ignored
         Colours: Ignored
         """
+        __slots__ = ("value", "min", "max", "step", "suffix", "suffix_plural")
+
         def __init__(self):
             super().__init__()
 
@@ -517,6 +536,8 @@ class Backend(BackendBase):
         Parameters: Required
         Colours: Ignored
         """
+        __slots__ = ()
+
         def __init__(self):
             super().__init__()
 
@@ -604,13 +625,24 @@ class BackendHelpers():
         """
         Returns a integer list of USB PIDs for a VID plugged into the system.
         """
-        vendor_files = glob.glob("/sys/bus/usb/devices/*/idVendor")
         found_pids = []
-        for vendor in vendor_files:
-            with open(vendor, "r") as f:
-                vid = str(f.read()).strip().upper()
+
+        # Enumerate the bus in one directory scan, instead of glob stat'ing
+        # a pattern for every device.
+        try:
+            entries = os.scandir("/sys/bus/usb/devices")
+        except OSError:
+            return found_pids
+
+        with entries:
+            for entry in entries:
+                vendor_path = os.path.join(entry.path, "idVendor")
+                if not os.path.exists(vendor_path):
+                    continue
+                with open(vendor_path, "r") as f:
+                    vid = str(f.read()).strip().upper()
                 if vid == vid_to_find:
-                    with open(os.path.dirname(vendor) + "/idProduct") as f:
+                    with open(os.path.join(entry.path, "idProduct")) as f:
                         pid = str(f.read()).strip().upper()
                         found_pids.append(pid)
         return found_pids
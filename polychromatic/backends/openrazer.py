@@ -17,6 +17,36 @@ import openrazer.client as rclient # pylint: disable=import-error
 from .. import common
 from ._backend import Backend as Backend
 
+# Immutable lookup tables used while building device objects. Declared once
+# here so they aren't reallocated for every device, zone and capability check.
+
+# Some of these 'device types' originate from legacy OpenRazer versions
+OPENRAZER_TO_POLY_FORM_FACTOR = {
+    "firefly": "mousemat",
+    "tartarus": "keypad",
+    "core": "gpu",
+    "mug": "accessory"
+}
+
+# Known DPI stages for hardware, keyed by the maximum DPI
+DEFAULT_DPI_STAGES = {
+    16000: (800, 1800, 4500, 9000, 16000),
+    8500: (800, 1600, 3200, 6400, 8500),
+    8200: (800, 1800, 3200, 6400, 8200),
+}
+
+ZONE_TO_CAPABILITY = {
+    "main": "lighting",
+    "logo": "lighting_logo",
+    "scroll": "lighting_scroll",
+    "backlight": "lighting_backlight",
+    "left": "lighting_left",
+    "right": "lighting_right",
+    "charging": "lighting_charging",
+    "fast_charging": "lighting_fast_charging",
+    "fully_charged": "lighting_fully_charged",
+}
+
 
 class OpenRazerBackend(Backend):
     """
@@ -339,18 +369,12 @@ class OpenRazerBackend(Backend):
             dpi = DPI(rdevice)
 
         # Determine DPI stages, or generate them if not known
-        default_stages = {
-            16000: [800, 1800, 4500, 9000, 16000],
-            8500: [800, 1600, 3200, 6400, 8500],
-            8200: [800, 1800, 3200, 6400, 8200],
-        }
-
         def _autogen_stage(value):
             """Guess a 'valid' DPI based on maximum as calculations may cause invalid range."""
             return round(value / 100) * 100
 
         try:
-            stages = default_stages[dpi.max]
+            stages = DEFAULT_DPI_STAGES[dpi.max]
         except KeyError:
             stages = [
                 _autogen_stage(dpi.max / 10),
@@ -373,6 +397,7 @@ class OpenRazerBackend(Backend):
         This is used for devices that have a fixed DPI and do not support the
         'variable' slider.
         """
+        _ = self._
         current_dpi = int(rdevice.dpi[0])
         parameters = []
 
@@ -380,8 +405,8 @@ class OpenRazerBackend(Backend):
             param = Backend.Option.Parameter()
             param.data = int(dpi)
             param.label = "{0} Hz".format(dpi)
-            param.active = True if dpi == current_dpi else False
-            param.default = True if index == 0 else False
+            param.active = dpi == current_dpi
+            param.default = index == 0
             parameters.append(param)
 
         class FixedDPIOption(Backend.MultipleChoiceOption):
@@ -395,14 +420,14 @@ class OpenRazerBackend(Backend):
                 current_dpi = int(self._rdevice.dpi[0])
                 for param in self.parameters:
                     # Round up internally just in case DPI is not an exact value
-                    param.active = True if round(param.data, -1) == round(current_dpi, -1) else False
+                    param.active = round(param.data, -1) == round(current_dpi, -1)
 
             def apply(self, new_value):
                 # Device only supports fixed DPI X values, such as DeathAdder 3.5G (#209)
                 self._rdevice.dpi = (int(new_value), 0)
 
         fixed_dpi = FixedDPIOption(rdevice, parameters)
-        fixed_dpi.label = self._("DPI")
+        fixed_dpi.label = _("DPI")
         fixed_dpi.icon = self.get_icon("general", "dpi")
 
         return fixed_dpi
@@ -461,6 +486,7 @@ class OpenRazerBackend(Backend):
         """
         Returns a list of Backend.DeviceItem.Zone objects.
         """
+        _ = self._
         zones = []
         device_name = str(rdevice.name)
 
@@ -480,37 +506,37 @@ class OpenRazerBackend(Backend):
         zones.append(zone)
 
         if rdevice.has("lighting_scroll") or rdevice.has("lighting_scroll_active"):
-            _add_zone("scroll", self._("Scroll Wheel"))
+            _add_zone("scroll", _("Scroll Wheel"))
 
         if rdevice.has("lighting_logo") or rdevice.has("lighting_logo_active"):
             # This zone may be more personalized for some devices
             zone = Backend.DeviceItem.Zone()
             zone.zone_id = "logo"
-            zone.label = self._("Logo")
+            zone.label = _("Logo")
             zone.icon = self.get_icon("zones", "logo")
 
             if device_name.startswith("Razer Nex"):
-                zone.label = self._("Hex Ring")
+                zone.label = _("Hex Ring")
                 zone.icon = self.get_icon("zones", "naga-hex-ring")
 
             if device_name.startswith("Razer Blade"):
-                zone.label = self._("Laptop Lid")
+                zone.label = _("Laptop Lid")
                 zone.icon = self.get_icon("zones", "blade-logo")
 
             zones.append(zone)
 
         if rdevice.has("lighting_left"):
-            _add_zone("left", self._("Left"))
+            _add_zone("left", _("Left"))
         if rdevice.has("lighting_right"):
-            _add_zone("right", self._("Right"))
+            _add_zone("right", _("Right"))
         if rdevice.has("lighting_backlight"):
-            _add_zone("backlight", self._("Backlight"))
+            _add_zone("backlight", _("Backlight"))
         if rdevice.has("lighting_charging"):
-            _add_zone("charging", self._("Charging"))
+            _add_zone("charging", _("Charging"))
         if rdevice.has("lighting_fast_charging"):
-            _add_zone("fast_charging", self._("Fast Charging"))
+            _add_zone("fast_charging", _("Fast Charging"))
         if rdevice.has("lighting_fully_charged"):
-            _add_zone("fully_charged", self._("Fully Charging"))
+            _add_zone("fully_charged", _("Fully Charging"))
 
         return zones
 
@@ -521,16 +547,8 @@ class OpenRazerBackend(Backend):
         device_name = rdevice.name
         device_type = rdevice.type
 
-        # Some of these 'device types' originate from legacy OpenRazer versions
-        openrazer_to_poly = {
-            "firefly": "mousemat",
-            "tartarus": "keypad",
-            "core": "gpu",
-            "mug": "accessory"
-        }
-
-        if device_type in openrazer_to_poly:
-            form_factor_id = openrazer_to_poly[device_type]
+        if device_type in OPENRAZER_TO_POLY_FORM_FACTOR:
+            form_factor_id = OPENRAZER_TO_POLY_FORM_FACTOR[device_type]
         else:
             form_factor_id = device_type
 
@@ -627,23 +645,11 @@ class OpenRazerBackend(Backend):
         Returns a boolean whether the capability is available for the specified zone.
         For example, "active" for zone "logo" will check "lighting_logo_active"
         """
-        zone_to_capability = {
-            "main": "lighting",
-            "logo": "lighting_logo",
-            "scroll": "lighting_scroll",
-            "backlight": "lighting_backlight",
-            "left": "lighting_left",
-            "right": "lighting_right",
-            "charging": "lighting_charging",
-            "fast_charging": "lighting_fast_charging",
-            "fully_charged": "lighting_fully_charged",
-        }
-
         # Brightness for the "root" (main) zone does not use the "lighting_" prefix.
         if capability == "brightness" and zone.zone_id == "main" and rdevice.has("brightness"):
             return True
 
-        return rdevice.has(zone_to_capability[zone.zone_id] + "_" + capability)
+        return rdevice.has(ZONE_TO_CAPABILITY[zone.zone_id] + "_" + capability)
 
     def _get_brightness_option(self, rdevice, zone):
         """
@@ -656,6 +662,7 @@ class OpenRazerBackend(Backend):
 
         Returns None if brightness is unsupported for the zone.
         """
+        _ = self._
         if rdevice.has("brightness") and zone.zone_id == "main":
             # This is provided in the root element, not .fx
             rzone = rdevice
@@ -664,50 +671,21 @@ class OpenRazerBackend(Backend):
 
         # Device is a 'brightness' % variable
         if self._has_zone_capability(rdevice, zone, "brightness"):
-            class BrightnessSlider(Backend.SliderOption):
-                def __init__(self, rzone):
-                    super().__init__()
-                    self._rzone = rzone
-                    self.uid = "brightness"
-                    self.min = 0
-                    self.max = 100
-                    self.step = 5
-                    self.suffix = "%"
-                    self.suffix_plural = "%"
-
-                def refresh(self):
-                    self.value = int(round(self._rzone.brightness))
-
-                def apply(self, new_value):
-                    self._rzone.brightness = float(new_value)
-
             slider = BrightnessSlider(rzone)
-            slider.label = self._("Brightness")
+            slider.label = _("Brightness")
             slider.icon = self.get_icon("options", "brightness")
             return slider
 
         # Device uses an on/off state
         if self._has_zone_capability(rdevice, zone, "active"):
-            class BrightnessToggle(Backend.ToggleOption):
-                def __init__(self, rzone):
-                    super().__init__()
-                    self._rzone = rzone
-                    self.uid = "brightness"
-
-                def refresh(self):
-                    self.active = True if self._rzone.active else False
-
-                def apply(self, enabled):
-                    self._rzone.active = enabled
-
             toggle = BrightnessToggle(rzone)
-            toggle.label = self._("Brightness")
+            toggle.label = _("Brightness")
             toggle.icon = self.get_icon("options", "brightness")
             toggle.icon_enable = self.get_icon("params", "100")
             toggle.icon_disable = self.get_icon("params", "0")
-            toggle.label_enable = self._("On")
-            toggle.label_disable = self._("Off")
-            toggle.label_toggle = self._("Enabled")
+            toggle.label_enable = _("On")
+            toggle.label_disable = _("Off")
+            toggle.label_toggle = _("Enabled")
             return toggle
 
         # Device does not support this option
@@ -718,84 +696,35 @@ class OpenRazerBackend(Backend):
         Returns list of Backend.EffectOption objects by determining
         which options/parameters are available for this device and zone.
         """
+        _ = self._
         rzone = self._map_zone_id_to_rzone(rdevice, zone)
         options = []
 
         has_ripple = self._has_zone_capability(rdevice, zone, "ripple")
         has_ripple_random = self._has_zone_capability(rdevice, zone, "ripple_random")
 
-        # There isn't a single 'lighting_breath' in the capabilities list
-        has_breath_random = self._has_zone_capability(rdevice, zone, "breath_random")
-        has_breath_single = self._has_zone_capability(rdevice, zone, "breath_single")
-        has_breath_dual = self._has_zone_capability(rdevice, zone, "breath_dual")
-        has_breath_triple = self._has_zone_capability(rdevice, zone, "breath_triple")
-
-        # There isn't a single 'lighting_starlight' in the capabilities list
-        has_starlight_random = self._has_zone_capability(rdevice, zone, "starlight_random")
-        has_starlight_single = self._has_zone_capability(rdevice, zone, "starlight_single")
-        has_starlight_dual = self._has_zone_capability(rdevice, zone, "starlight_dual")
+        # There isn't a single 'lighting_breath' or 'lighting_starlight' in the
+        # capabilities list, so gather the supported variants into sets.
+        breath_types = {variant for variant in ("random", "single", "dual", "triple")
+                        if self._has_zone_capability(rdevice, zone, "breath_" + variant)}
+        starlight_types = {variant for variant in ("random", "single", "dual")
+                           if self._has_zone_capability(rdevice, zone, "starlight_" + variant)}
 
         if self._has_zone_capability(rdevice, zone, "none"):
-            class NoneOption(Backend.EffectOption):
-                def __init__(self, rzone, persistence):
-                    super().__init__()
-                    self._rzone = rzone
-                    self._persistence = persistence
-                    self.uid = "none"
-
-                def refresh(self):
-                    self.active = True if self._persistence.state["effect"] == "none" else False
-
-                def apply(self, param=None):
-                    self._rzone.none()
-                    self._persistence.save("effect", "none")
-
-            option = NoneOption(rzone, zone._persistence)
-            option.label = self._("None")
+            option = SimpleEffectOption("none", rzone, zone._persistence)
+            option.label = _("None")
             option.icon = self.get_icon("options", "none")
             options.append(option)
 
         if self._has_zone_capability(rdevice, zone, "spectrum"):
-            class SpectrumOption(Backend.EffectOption):
-                def __init__(self, rzone, persistence):
-                    super().__init__()
-                    self._rzone = rzone
-                    self._persistence = persistence
-                    self.uid = "spectrum"
-
-                def refresh(self):
-                    self.active = True if self._persistence.state["effect"] == "spectrum" else False
-
-                def apply(self, param=None):
-                    self._rzone.spectrum()
-                    self._persistence.save("effect", "spectrum")
-
-            option = SpectrumOption(rzone, zone._persistence)
-            option.label = self._("Spectrum")
+            option = SimpleEffectOption("spectrum", rzone, zone._persistence)
+            option.label = _("Spectrum")
             option.icon = self.get_icon("options", "spectrum")
             options.append(option)
 
         if self._has_zone_capability(rdevice, zone, "wave"):
-            class WaveOption(Backend.EffectOption):
-                def __init__(self, rzone, persistence):
-                    super().__init__()
-                    self._rzone = rzone
-                    self._persistence = persistence
-                    self.uid = "wave"
-
-                def refresh(self):
-                    self.active = True if self._persistence.state["effect"] == "wave" else False
-                    for param in self.parameters:
-                        param.active = True if self._persistence.state["wave_dir"] == param.data else False
-
-                def apply(self, direction):
-                    # direction: 1 or 2
-                    self._rzone.wave(int(direction))
-                    self._persistence.save("effect", "wave")
-                    self._persistence.save("wave_dir", str(direction))
-
             option = WaveOption(rzone, zone._persistence)
-            option.label = self._("Wave")
+            option.label = _("Wave")
             option.icon = self.get_icon("options", "wave")
 
             direction_1 = Backend.Option.Parameter()
@@ -807,70 +736,42 @@ class OpenRazerBackend(Backend):
 
             # Change parameter labels depending on orientation/device
             if rdevice.type == "mouse":
-                direction_1.label = self._("Up")
+                direction_1.label = _("Up")
                 direction_1.icon  = self.get_icon("params", "up")
-                direction_2.label = self._("Down")
+                direction_2.label = _("Down")
                 direction_2.icon  = self.get_icon("params", "down")
 
             elif rdevice.type == "mousemat":
-                direction_1.label = self._("Clockwise")
+                direction_1.label = _("Clockwise")
                 direction_1.icon  = self.get_icon("params", "clock")
-                direction_2.label = self._("Anti-clockwise")
+                direction_2.label = _("Anti-clockwise")
                 direction_2.icon  = self.get_icon("params", "anticlock")
 
             else:
-                direction_1.label = self._("Right")
+                direction_1.label = _("Right")
                 direction_1.icon = self.get_icon("params", "right")
-                direction_2.label = self._("Left")
+                direction_2.label = _("Left")
                 direction_2.icon = self.get_icon("params", "left")
 
             option.parameters = [direction_2, direction_1]
             options.append(option)
 
         if has_ripple or has_ripple_random:
-            class RippleOption(Backend.EffectOption):
-                def __init__(self, rzone, persistence):
-                    super().__init__()
-                    self._rzone = rzone
-                    self._persistence = persistence
-                    self.uid = "ripple"
-                    self.colours = persistence.state["colours"]
-
-                def refresh(self):
-                    current_effect = self._persistence.state["effect"]
-                    self.active = True if current_effect in ["ripple", "rippleRandomColour"] else False
-                    for param in self.parameters:
-                        if param.data == "random":
-                            param.active = True if current_effect == "rippleRandomColour" else False
-                        elif param.data == "single":
-                            param.active = True if current_effect == "ripple" else False
-                    self.colours = self._persistence.state["colours"]
-
-                def apply(self, ripple_type):
-                    if str(ripple_type) == "random":
-                        self._rzone.ripple_random()
-                        self._persistence.save("effect", "rippleRandomColour")
-                    elif str(ripple_type) == "single":
-                        rgb = common.hex_to_rgb(self.colours[0])
-                        self._rzone.ripple(rgb[0], rgb[1], rgb[2])
-                        self._persistence.save("effect", "ripple")
-                        self._persistence.save("colour_1", self.colours[0])
-
             option = RippleOption(rzone, zone._persistence)
-            option.label = self._("Ripple")
+            option.label = _("Ripple")
             option.icon = self.get_icon("options", "ripple")
 
             if has_ripple_random:
                 random = Backend.Option.Parameter()
                 random.data = "random"
-                random.label = self._("Random")
+                random.label = _("Random")
                 random.icon = self.get_icon("params", "random")
                 option.parameters.append(random)
 
             if has_ripple:
                 single = Backend.Option.Parameter()
                 single.data = "single"
-                single.label = self._("Single")
+                single.label = _("Single")
                 single.icon = self.get_icon("params", "single")
                 single.colours_required = 1
                 single.default = True
@@ -879,49 +780,27 @@ class OpenRazerBackend(Backend):
             options.append(option)
 
         if self._has_zone_capability(rdevice, zone, "reactive"):
-            class ReactiveOption(Backend.EffectOption):
-                def __init__(self, rzone, persistence):
-                    super().__init__()
-                    self._rzone = rzone
-                    self._persistence = persistence
-                    self.uid = "reactive"
-                    self.colours_required = 1
-                    self.colours = self._persistence.state["colours"]
-
-                def refresh(self):
-                    self.active = True if self._persistence.state["effect"] == "reactive" else False
-                    for param in self.parameters:
-                        param.active = True if self._persistence.state["speed"] == param.data else False
-                    self.colours = self._persistence.state["colours"]
-
-                def apply(self, speed):
-                    rgb = common.hex_to_rgb(self.colours[0])
-                    self._rzone.reactive(rgb[0], rgb[1], rgb[2], int(speed))
-                    self._persistence.save("effect", "reactive")
-                    self._persistence.save("speed", str(speed))
-                    self._persistence.save("colour_1", self.colours[0])
-
             option = ReactiveOption(rzone, zone._persistence)
-            option.label = self._("Reactive")
+            option.label = _("Reactive")
             option.icon = self.get_icon("options", "reactive")
 
             fast = Backend.Option.Parameter()
             fast.data = 1
-            fast.label = self._("Fast (0.5s)")
+            fast.label = _("Fast (0.5s)")
             fast.icon = self.get_icon("params", "fast")
 
             medium = Backend.Option.Parameter()
             medium.data = 2
-            medium.label = self._("Medium (1s)")
+            medium.label = _("Medium (1s)")
             medium.default = True
 
             slow = Backend.Option.Parameter()
             slow.data = 3
-            slow.label = self._("Slow (1.5s)")
+            slow.label = _("Slow (1.5s)")
 
             vslow = Backend.Option.Parameter()
             vslow.data = 4
-            vslow.label = self._("Very Slow (2s)")
+            vslow.label = _("Very Slow (2s)")
             vslow.icon = self.get_icon("params", "slow")
 
             for param in [fast, medium, slow, vslow]:
@@ -933,229 +812,93 @@ class OpenRazerBackend(Backend):
             # Chroma Mug Holder is the only one to have it in the "main" zone, but there's no Python API call.
             # API only exposes for 'logo' and 'scroll'. Some mice use it.
             if zone in ["logo", "scroll"]:
-                class BlinkingOption(Backend.EffectOption):
-                    def __init__(self, rzone, persistence):
-                        super().__init__()
-                        self._rzone = rzone
-                        self._persistence = persistence
-                        self.uid = "blinking"
-                        self.colours_required = 1
-                        self.colours = self._persistence.state["colours"]
-
-                    def refresh(self):
-                        self.active = True if self._persistence.state["colours"] == "blinking" else False
-                        self.colours = self._persistence.state["colours"]
-
-                    def apply(self, param=None):
-                        rgb = common.hex_to_rgb(self.colours[0])
-                        self._rzone.blinking(rgb[0], rgb[1], rgb[2])
-                        self._persistence.save("effect", "blinking")
-                        self._persistence.save("colour_1", self.colours[0])
-
                 option = BlinkingOption(rzone, zone._persistence)
-                option.label = self._("Blinking")
+                option.label = _("Blinking")
                 option.icon = self.get_icon("options", "blinking")
                 options.append(option)
 
         if self._has_zone_capability(rdevice, zone, "static"):
-            class StaticOption(Backend.EffectOption):
-                def __init__(self, rzone, persistence):
-                    super().__init__()
-                    self._rzone = rzone
-                    self._persistence = persistence
-                    self.uid = "static"
-                    self.colours_required = 1
-                    self.colours = self._persistence.state["colours"]
-
-                def refresh(self):
-                    self.active = True if self._persistence.state["effect"] == "static" else False
-                    self.colours = self._persistence.state["colours"]
-
-                def apply(self, param=None):
-                    rgb = common.hex_to_rgb(self.colours[0])
-                    self._rzone.static(rgb[0], rgb[1], rgb[2])
-                    self._persistence.save("effect", "static")
-                    self._persistence.save("colour_1", self.colours[0])
-
             option = StaticOption(rzone, zone._persistence)
-            option.label = self._("Static")
+            option.label = _("Static")
             option.icon = self.get_icon("options", "static")
             options.append(option)
 
-        if has_breath_random or has_breath_single or has_breath_dual or has_breath_triple:
-            class BreathOption(Backend.EffectOption):
-                def __init__(self, rzone, persistence):
-                    super().__init__()
-                    self._rzone = rzone
-                    self._persistence = persistence
-                    self.uid = "breath"
-                    self.colours = self._persistence.state["colours"]
-
-                def refresh(self):
-                    current_effect = self._persistence.state["effect"]
-                    if not current_effect.startswith("breath"):
-                        self.active = False
-                        return
-                    self.active = True
-                    current_breath_type = current_effect.split("breath")[1].lower()
-                    for param in self.parameters:
-                        param.active = True if current_breath_type == param.data else False
-                    self.colours = self._persistence.state["colours"]
-
-                def apply(self, breath_type):
-                    rgb = []
-                    for colour in self.colours:
-                        rgb.append(common.hex_to_rgb(colour))
-
-                    if breath_type == "random":
-                        self._rzone.breath_random()
-                        self._persistence.save("effect", "breathRandom")
-                    elif breath_type == "single":
-                        self._rzone.breath_single(rgb[0][0], rgb[0][1], rgb[0][2])
-                        self._persistence.save("effect", "breathSingle")
-                        self._persistence.save("colour_1", self.colours[0])
-                    elif breath_type == "dual":
-                        self._rzone.breath_dual(rgb[0][0], rgb[0][1], rgb[0][2],
-                                                rgb[1][0], rgb[1][1], rgb[1][2])
-                        self._persistence.save("effect", "breathDual")
-                        self._persistence.save("colour_1", self.colours[0])
-                        self._persistence.save("colour_2", self.colours[1])
-                    elif breath_type == "triple":
-                        self._rzone.breath_triple(rgb[0][0], rgb[0][1], rgb[0][2],
-                                                  rgb[1][0], rgb[1][1], rgb[1][2],
-                                                  rgb[2][0], rgb[2][1], rgb[2][2])
-                        self._persistence.save("effect", "breathTriple")
-                        self._persistence.save("colour_1", self.colours[0])
-                        self._persistence.save("colour_2", self.colours[1])
-                        self._persistence.save("colour_3", self.colours[2])
-                    else:
-                        raise KeyError("Unknown breath type: " + breath_type)
-
+        if breath_types:
             option = BreathOption(rzone, zone._persistence)
-            option.label = self._("Breath")
+            option.label = _("Breath")
             option.icon = self.get_icon("options", "breath")
 
-            if has_breath_random:
+            if "random" in breath_types:
                 random = Backend.Option.Parameter()
                 random.data = "random"
-                random.label = self._("Random")
+                random.label = _("Random")
                 random.icon = self.get_icon("params", "random")
                 option.parameters.append(random)
 
-            if has_breath_single:
+            if "single" in breath_types:
                 single = Backend.Option.Parameter()
                 single.data = "single"
-                single.label = self._("Single")
+                single.label = _("Single")
                 single.icon = self.get_icon("params", "single")
                 single.colours_required = 1
                 single.default = True
                 option.parameters.append(single)
 
-            if has_breath_dual:
+            if "dual" in breath_types:
                 dual = Backend.Option.Parameter()
                 dual.data = "dual"
-                dual.label = self._("Dual")
+                dual.label = _("Dual")
                 dual.icon = self.get_icon("params", "dual")
                 dual.colours_required = 2
                 option.parameters.append(dual)
 
-            if has_breath_triple:
+            if "triple" in breath_types:
                 triple = Backend.Option.Parameter()
                 triple.data = "triple"
-                triple.label = self._("Triple")
+                triple.label = _("Triple")
                 triple.icon = self.get_icon("params", "triple")
                 triple.colours_required = 3
                 option.parameters.append(triple)
 
             options.append(option)
 
-        if has_starlight_random or has_starlight_single or has_starlight_dual:
-            class StarlightOption(Backend.EffectOption):
-                def __init__(self, rzone, persistence):
-                    super().__init__()
-                    self._rzone = rzone
-                    self._persistence = persistence
-                    self.uid = "starlight"
-                    self.colours = self._persistence.state["colours"]
-
-                def refresh(self):
-                    current_effect = self._persistence.state["effect"]
-                    if not current_effect.startswith("starlight"):
-                        self.active = False
-                        return
-                    self.active = True
-                    current_starlight = current_effect.split("starlight")[1].lower()
-                    current_speed = self._persistence.state["speed"]
-                    self.active = True if current_effect.startswith("starlight") else False
-                    for param in self.parameters:
-                        param.active = False
-                        starlight_type, starlight_speed = param.data.split(":")
-                        if current_starlight == starlight_type and str(current_speed) == starlight_speed:
-                            param.active = True
-                    self.colours = self._persistence.state["colours"]
-
-                def apply(self, data):
-                    # Param Example: "random:2" for a Medium (2) Random Starlight
-                    starlight_type = data.split(":")[0]
-                    starlight_speed = int(data.split(":")[1])
-
-                    rgb = []
-                    for colour in self.colours:
-                        rgb.append(common.hex_to_rgb(colour))
-
-                    if starlight_type == "random":
-                        self._rzone.starlight_random(starlight_speed)
-                        self._persistence.save("effect", "starlightRandom")
-                    elif starlight_type == "single":
-                        self._rzone.starlight_single(rgb[0][0], rgb[0][1], rgb[0][2], starlight_speed)
-                        self._persistence.save("colour_1", self.colours[0])
-                        self._persistence.save("effect", "starlightSingle")
-                    elif starlight_type == "dual":
-                        self._rzone.starlight_dual(rgb[0][0], rgb[0][1], rgb[0][2],
-                                                   rgb[1][0], rgb[1][1], rgb[1][2], starlight_speed)
-                        self._persistence.save("colour_1", self.colours[0])
-                        self._persistence.save("colour_2", self.colours[1])
-                        self._persistence.save("effect", "starlightDual")
-                    else:
-                        raise KeyError("Unknown starlight parameter:" + str(data))
-                    self._persistence.save("speed", starlight_speed)
-
+        if starlight_types:
             option = StarlightOption(rzone, zone._persistence)
-            option.label = self._("Starlight")
+            option.label = _("Starlight")
             option.icon = self.get_icon("options", "starlight")
 
             speeds = {
-                1: self._("Fast"),
-                2: self._("Medium"),
-                3: self._("Slow"),
+                1: _("Fast"),
+                2: _("Medium"),
+                3: _("Slow"),
             }
 
-            if has_starlight_random:
+            if "random" in starlight_types:
                 for speed in speeds.keys():
                     random = Backend.Option.Parameter()
                     random.data = "random:" + str(speed)
                     random._speed = speed
-                    random.label = "{0} ({1})".format(self._("Random"), speeds[speed])
+                    random.label = "{0} ({1})".format(_("Random"), speeds[speed])
                     random.icon = self.get_icon("params", "random")
                     option.parameters.append(random)
 
-            if has_starlight_single:
+            if "single" in starlight_types:
                 for speed in speeds.keys():
                     single = Backend.Option.Parameter()
                     single.data = "single:" + str(speed)
                     single._speed = speed
-                    single.label = "{0} ({1})".format(self._("Single"), speeds[speed])
+                    single.label = "{0} ({1})".format(_("Single"), speeds[speed])
                     single.icon = self.get_icon("params", "single")
                     single.colours_required = 1
                     single.default = True
                     option.parameters.append(single)
 
-            if has_starlight_dual:
+            if "dual" in starlight_types:
                 for speed in speeds.keys():
                     dual = Backend.Option.Parameter()
                     dual.data = "dual:" + str(speed)
                     dual._speed = speed
-                    dual.label = "{0} ({1})".format(self._("Dual"), speeds[speed])
+                    dual.label = "{0} ({1})".format(_("Dual"), speeds[speed])
                     dual.icon = self.get_icon("params", "dual")
                     dual.colours_required = 2
                     option.parameters.append(dual)
@@ -1175,6 +918,7 @@ class OpenRazerBackend(Backend):
             - As a workaround, bypass the pylib and echo directly to the sysfs driver.
             - See also: #345, openrazer/openrazer#1575
         """
+        _ = self._
         try:
             if "razer.device.lighting.bw2013" in rdevice._available_features.keys():
                 vidpid = self._get_device_vid_pid(rdevice)
@@ -1196,7 +940,7 @@ class OpenRazerBackend(Backend):
                         self.uid = "pulsate"
 
                     def refresh(self):
-                        self.active = True if self._persistence.state["effect"] == "pulsate" else False
+                        self.active = self._persistence.state["effect"] == "pulsate"
 
                     def apply(self, param=None):
                         with open(self.sysfs_path, "w") as f:
@@ -1211,7 +955,7 @@ class OpenRazerBackend(Backend):
                         self.uid = "static"
 
                     def refresh(self):
-                        self.active = True if self._persistence.state["effect"] == "static" else False
+                        self.active = self._persistence.state["effect"] == "static"
 
                     def apply(self, param=None):
                         with open(self.sysfs_path, "w") as f:
@@ -1219,11 +963,11 @@ class OpenRazerBackend(Backend):
                         self._persistence.save("effect", "static")
 
                 pulsate = PulsateOptionBW2013(persistence, matrix_file_pulsate)
-                pulsate.label = self._("Pulsate")
+                pulsate.label = _("Pulsate")
                 pulsate.icon = self.get_icon("options", "pulsate")
 
                 static = StaticOptionBW2013(persistence, matrix_file_static)
-                static.label = self._("Static")
+                static.label = _("Static")
                 static.icon = self.get_icon("options", "static")
 
                 self.debug("Using sysfs workaround for Pulsate/Static")
@@ -1238,6 +982,7 @@ class OpenRazerBackend(Backend):
         """
         Returns a Backend.Option derivative object for setting a mouse's poll rate.
         """
+        _ = self._
         current_rate = int(rdevice.poll_rate)
         parameters = []
 
@@ -1251,13 +996,13 @@ class OpenRazerBackend(Backend):
         for rate in supported_poll_rates:
             param = Backend.Option.Parameter()
             param.data = rate
-            param.active = True if current_rate == rate else False
+            param.active = current_rate == rate
 
             # 500 Hz  = 2 millisecond latency
             # 1000 Hz = 1 millisecond latency
             # 2000 Hz = 0.5 millisecond latency
             msecs = float(1000 / rate)
-            param.label = self._("X Hz (Y msec latency)").replace("X", str(rate)).replace("Y", str(int(msecs) if msecs.is_integer() else msecs))
+            param.label = _("X Hz (Y msec latency)").replace("X", str(rate)).replace("Y", str(int(msecs) if msecs.is_integer() else msecs))
 
             if rate > 1000:
                 param.icon = self.get_icon("params", "poll_hyper")
@@ -1280,13 +1025,13 @@ class OpenRazerBackend(Backend):
             def refresh(self):
                 current_rate = int(self._rdevice.poll_rate)
                 for param in self.parameters:
-                    param.active = True if param.data == current_rate else False
+                    param.active = param.data == current_rate
 
             def apply(self, new_value):
                 self._rdevice.poll_rate = int(new_value)
 
         poll_rate = PollRateOption(rdevice, parameters)
-        poll_rate.label = self._("Poll Rate")
+        poll_rate.label = _("Poll Rate")
         poll_rate.icon = self.get_icon("options", "poll_rate")
         return poll_rate
 
@@ -1294,6 +1039,7 @@ class OpenRazerBackend(Backend):
         """
         Returns a Backend.Option derivative object for the hardware's game mode feature.
         """
+        _ = self._
         class GameModeOption(Backend.ToggleOption):
             def __init__(self, rdevice):
                 super().__init__()
@@ -1301,14 +1047,14 @@ class OpenRazerBackend(Backend):
                 self.uid = "game_mode"
 
             def refresh(self):
-                self.active = True if rdevice.game_mode_led else False
+                self.active = bool(rdevice.game_mode_led)
 
             def apply(self, enabled):
                 self._rdevice.game_mode_led = enabled
 
         option = GameModeOption(rdevice)
-        option.label =  self._("Game Mode")
-        option.label_toggle = self._("Disable Alt+Tab, Alt+F4 and Win keys")
+        option.label =  _("Game Mode")
+        option.label_toggle = _("Disable Alt+Tab, Alt+F4 and Win keys")
         option.icon = self.get_icon("options", "game_mode")
         option.icon_enable = self.get_icon("options", "game_mode")
         option.icon_disable = self.get_icon("options", "game_mode_off")
@@ -1320,73 +1066,31 @@ class OpenRazerBackend(Backend):
 
         In OpenRazer >= 3.2.0, low power and sleep mode are exposed as individual capabilities.
         """
+        _ = self._
         options = []
         persistence = OpenRazerPersistenceFallback("main", rdevice.serial, self.persistence_fallback_path)
 
         # This is the amount of time before the device enters "sleep mode"
         if rdevice.has("get_idle_time") or rdevice.has("set_idle_time"):
-            class IdleTimeOptionSetOnly(Backend.SliderOption):
-                def __init__(self, rdevice, persistence):
-                    # Device stores idle time in seconds. Present as minutes.
-                    super().__init__()
-                    self._rdevice = rdevice
-                    self._persistence = persistence
-                    self.uid = "idle_time"
-                    self.min = 1
-                    self.max = 15
-
-                def refresh(self):
-                    self.value = int(int(self._persistence.get("idle_time")) / 60)
-
-                def apply(self, new_value):
-                    self._rdevice.set_idle_time(int(new_value) * 60)
-                    self._persistence.save("idle_time", int(new_value) * 60)
-
-            class IdleTimeOptionSetGet(IdleTimeOptionSetOnly):
-                def refresh(self):
-                    self.value = int(self._rdevice.get_idle_time() / 60)
-
             if rdevice.has("get_idle_time"):
                 idle_time = IdleTimeOptionSetGet(rdevice, persistence)
             else:
                 idle_time = IdleTimeOptionSetOnly(rdevice, persistence)
 
-            idle_time.label = self._("Sleep mode after")
+            idle_time.label = _("Sleep mode after")
             idle_time.icon = self.get_icon("options", "sleep")
-            idle_time.suffix = ' ' + self._("minute")
-            idle_time.suffix_plural = ' ' + self._("minutes")
+            idle_time.suffix = ' ' + _("minute")
+            idle_time.suffix_plural = ' ' + _("minutes")
             options.append(idle_time)
 
         # This is the battery percentage before the device enters a low power mode.
         if rdevice.has("get_low_battery_threshold") or rdevice.has("set_low_battery_threshold"):
-            class LowBatteryThresholdOptionSetOnly(Backend.SliderOption):
-                def __init__(self, rdevice, persistence):
-                    super().__init__()
-                    self._rdevice = rdevice
-                    self._persistence = persistence
-                    self.uid = "low_battery_threshold"
-                    self.min = 1
-                    self.max = 100
-                    self.suffix = "%"
-                    self.suffix_plural = "%"
-
-                def refresh(self):
-                    self.value = int(self._persistence.get("low_battery_threshold"))
-
-                def apply(self, new_value):
-                    self._rdevice.set_low_battery_threshold(int(new_value))
-                    self._persistence.save("low_battery_threshold", int(new_value))
-
-            class LowBatteryThresholdOptionSetGet(LowBatteryThresholdOptionSetOnly):
-                def refresh(self):
-                    self.value = int(self._rdevice.get_low_battery_threshold())
-
             if rdevice.has("get_low_battery_threshold"):
                 low_power = LowBatteryThresholdOptionSetGet(rdevice, persistence)
             else:
                 low_power = LowBatteryThresholdOptionSetOnly(rdevice, persistence)
 
-            low_power.label = self._("Enter low power at")
+            low_power.label = _("Enter low power at")
             low_power.icon = self.get_icon("options", "low_battery")
             options.append(low_power)
 
@@ -1396,17 +1100,18 @@ class OpenRazerBackend(Backend):
         """
         Additional mouse features supported by Razer Basilisk V3 since OpenRazer 3.3.0.
         """
+        _ = self._
         options = []
 
         if rdevice.has("scroll_mode"):
             tactile = Backend.Option.Parameter()
             tactile.data = 0
-            tactile.label = self._("Tactile")
+            tactile.label = _("Tactile")
             tactile.default = True
 
             free_spin = Backend.Option.Parameter()
             free_spin.data = 1
-            free_spin.label = self._("Free Spin")
+            free_spin.label = _("Free Spin")
 
             class ScrollMode(Backend.MultipleChoiceOption):
                 def __init__(self, rdevice):
@@ -1422,7 +1127,7 @@ class OpenRazerBackend(Backend):
 
             scroll_mode = ScrollMode(rdevice)
             scroll_mode.uid = "scroll_mode"
-            scroll_mode.label = self._("Scroll Mode")
+            scroll_mode.label = _("Scroll Mode")
             scroll_mode.icon = self.get_icon("devices", "mouse")
             scroll_mode.parameters = [tactile, free_spin]
             scroll_mode.refresh()
@@ -1442,9 +1147,9 @@ class OpenRazerBackend(Backend):
 
             scroll_accel = ScrollAcceleration(rdevice)
             scroll_accel.uid = "scroll_accel"
-            scroll_accel.label = self._("Scroll Acceleration")
+            scroll_accel.label = _("Scroll Acceleration")
             scroll_accel.icon = self.get_icon("devices", "mouse")
-            scroll_accel.label_toggle = self._("Enable scroll acceleration")
+            scroll_accel.label_toggle = _("Enable scroll acceleration")
             scroll_accel.refresh()
             options.append(scroll_accel)
 
@@ -1462,9 +1167,9 @@ class OpenRazerBackend(Backend):
 
             smart_reel = SmartReel(rdevice)
             smart_reel.uid = "scroll_smart_reel"
-            smart_reel.label = self._("Smart Reel")
+            smart_reel.label = _("Smart Reel")
             smart_reel.icon = self.get_icon("devices", "mouse")
-            smart_reel.label_toggle = self._("Enable smart reel")
+            smart_reel.label_toggle = _("Enable smart reel")
             smart_reel.refresh()
             options.append(smart_reel)
 
@@ -1474,14 +1179,15 @@ class OpenRazerBackend(Backend):
         """
         Additional mouse features supported by Razer Huntsman V2 since OpenRazer 3.4.0.
         """
+        _ = self._
         typing = Backend.Option.Parameter()
         typing.data = False
-        typing.label = self._("Typing (Increased debounce delay)")
+        typing.label = _("Typing (Increased debounce delay)")
         typing.default = True
 
         gaming = Backend.Option.Parameter()
         gaming.data = True
-        gaming.label = self._("Gaming (Faster triggering)")
+        gaming.label = _("Gaming (Faster triggering)")
 
         class KeyswitchOptimisation(Backend.MultipleChoiceOption):
             def __init__(self, rdevice):
@@ -1497,7 +1203,7 @@ class OpenRazerBackend(Backend):
 
         option = KeyswitchOptimisation(rdevice)
         option.uid = "keyswitch_optimisation"
-        option.label = self._("Optimise for")
+        option.label = _("Optimise for")
         option.icon = self.get_icon("devices", "keyboard")
         option.parameters = [typing, gaming]
         option.refresh()
@@ -1526,6 +1232,345 @@ class OpenRazerBackend(Backend):
         time.sleep(2)
 
 
+class BrightnessSlider(Backend.SliderOption):
+    __slots__ = ("_rzone",)
+
+    def __init__(self, rzone):
+        super().__init__()
+        self._rzone = rzone
+        self.uid = "brightness"
+        self.min = 0
+        self.max = 100
+        self.step = 5
+        self.suffix = "%"
+        self.suffix_plural = "%"
+
+    def refresh(self):
+        self.value = int(round(self._rzone.brightness))
+
+    def apply(self, new_value):
+        self._rzone.brightness = float(new_value)
+
+
+class BrightnessToggle(Backend.ToggleOption):
+    __slots__ = ("_rzone",)
+
+    def __init__(self, rzone):
+        super().__init__()
+        self._rzone = rzone
+        self.uid = "brightness"
+
+    def refresh(self):
+        self.active = bool(self._rzone.active)
+
+    def apply(self, enabled):
+        self._rzone.active = enabled
+
+
+class SimpleEffectOption(Backend.EffectOption):
+    """
+    An effect that takes no parameters or colours. The daemon function shares
+    the name of the effect, e.g. rzone.spectrum() for "spectrum".
+
+    These option classes are defined once at module level (instead of inside
+    _get_effect_options) so building the device objects doesn't re-create the
+    class objects for every device and zone.
+    """
+    __slots__ = ("_rzone", "_persistence")
+
+    def __init__(self, uid, rzone, persistence):
+        super().__init__()
+        self._rzone = rzone
+        self._persistence = persistence
+        self.uid = uid
+
+    def refresh(self):
+        self.active = self._persistence.state["effect"] == self.uid
+
+    def apply(self, param=None):
+        getattr(self._rzone, self.uid)()
+        self._persistence.save("effect", self.uid)
+
+
+class WaveOption(Backend.EffectOption):
+    __slots__ = ("_rzone", "_persistence")
+
+    def __init__(self, rzone, persistence):
+        super().__init__()
+        self._rzone = rzone
+        self._persistence = persistence
+        self.uid = "wave"
+
+    def refresh(self):
+        self.active = self._persistence.state["effect"] == "wave"
+        for param in self.parameters:
+            param.active = self._persistence.state["wave_dir"] == param.data
+
+    def apply(self, direction):
+        # direction: 1 or 2
+        self._rzone.wave(int(direction))
+        self._persistence.save("effect", "wave")
+        self._persistence.save("wave_dir", str(direction))
+
+
+class RippleOption(Backend.EffectOption):
+    __slots__ = ("_rzone", "_persistence")
+
+    def __init__(self, rzone, persistence):
+        super().__init__()
+        self._rzone = rzone
+        self._persistence = persistence
+        self.uid = "ripple"
+        self.colours = persistence.state["colours"]
+
+    def refresh(self):
+        current_effect = self._persistence.state["effect"]
+        self.active = current_effect in ["ripple", "rippleRandomColour"]
+        for param in self.parameters:
+            if param.data == "random":
+                param.active = current_effect == "rippleRandomColour"
+            elif param.data == "single":
+                param.active = current_effect == "ripple"
+        self.colours = self._persistence.state["colours"]
+
+    def apply(self, ripple_type):
+        if str(ripple_type) == "random":
+            self._rzone.ripple_random()
+            self._persistence.save("effect", "rippleRandomColour")
+        elif str(ripple_type) == "single":
+            rgb = common.hex_to_rgb(self.colours[0])
+            self._rzone.ripple(rgb[0], rgb[1], rgb[2])
+            self._persistence.save("effect", "ripple")
+            self._persistence.save("colour_1", self.colours[0])
+
+
+class ReactiveOption(Backend.EffectOption):
+    __slots__ = ("_rzone", "_persistence")
+
+    def __init__(self, rzone, persistence):
+        super().__init__()
+        self._rzone = rzone
+        self._persistence = persistence
+        self.uid = "reactive"
+        self.colours_required = 1
+        self.colours = self._persistence.state["colours"]
+
+    def refresh(self):
+        self.active = self._persistence.state["effect"] == "reactive"
+        for param in self.parameters:
+            param.active = self._persistence.state["speed"] == param.data
+        self.colours = self._persistence.state["colours"]
+
+    def apply(self, speed):
+        rgb = common.hex_to_rgb(self.colours[0])
+        self._rzone.reactive(rgb[0], rgb[1], rgb[2], int(speed))
+        self._persistence.save("effect", "reactive")
+        self._persistence.save("speed", str(speed))
+        self._persistence.save("colour_1", self.colours[0])
+
+
+class BlinkingOption(Backend.EffectOption):
+    __slots__ = ("_rzone", "_persistence")
+
+    def __init__(self, rzone, persistence):
+        super().__init__()
+        self._rzone = rzone
+        self._persistence = persistence
+        self.uid = "blinking"
+        self.colours_required = 1
+        self.colours = self._persistence.state["colours"]
+
+    def refresh(self):
+        self.active = self._persistence.state["colours"] == "blinking"
+        self.colours = self._persistence.state["colours"]
+
+    def apply(self, param=None):
+        rgb = common.hex_to_rgb(self.colours[0])
+        self._rzone.blinking(rgb[0], rgb[1], rgb[2])
+        self._persistence.save("effect", "blinking")
+        self._persistence.save("colour_1", self.colours[0])
+
+
+class StaticOption(Backend.EffectOption):
+    __slots__ = ("_rzone", "_persistence")
+
+    def __init__(self, rzone, persistence):
+        super().__init__()
+        self._rzone = rzone
+        self._persistence = persistence
+        self.uid = "static"
+        self.colours_required = 1
+        self.colours = self._persistence.state["colours"]
+
+    def refresh(self):
+        self.active = self._persistence.state["effect"] == "static"
+        self.colours = self._persistence.state["colours"]
+
+    def apply(self, param=None):
+        rgb = common.hex_to_rgb(self.colours[0])
+        self._rzone.static(rgb[0], rgb[1], rgb[2])
+        self._persistence.save("effect", "static")
+        self._persistence.save("colour_1", self.colours[0])
+
+
+class BreathOption(Backend.EffectOption):
+    __slots__ = ("_rzone", "_persistence")
+
+    def __init__(self, rzone, persistence):
+        super().__init__()
+        self._rzone = rzone
+        self._persistence = persistence
+        self.uid = "breath"
+        self.colours = self._persistence.state["colours"]
+
+    def refresh(self):
+        current_effect = self._persistence.state["effect"]
+        if not current_effect.startswith("breath"):
+            self.active = False
+            return
+        self.active = True
+        current_breath_type = current_effect.split("breath")[1].lower()
+        for param in self.parameters:
+            param.active = current_breath_type == param.data
+        self.colours = self._persistence.state["colours"]
+
+    def apply(self, breath_type):
+        rgb = []
+        for colour in self.colours:
+            rgb.append(common.hex_to_rgb(colour))
+
+        if breath_type == "random":
+            self._rzone.breath_random()
+            self._persistence.save("effect", "breathRandom")
+        elif breath_type == "single":
+            self._rzone.breath_single(rgb[0][0], rgb[0][1], rgb[0][2])
+            self._persistence.save("effect", "breathSingle")
+            self._persistence.save("colour_1", self.colours[0])
+        elif breath_type == "dual":
+            self._rzone.breath_dual(rgb[0][0], rgb[0][1], rgb[0][2],
+                                    rgb[1][0], rgb[1][1], rgb[1][2])
+            self._persistence.save("effect", "breathDual")
+            self._persistence.save("colour_1", self.colours[0])
+            self._persistence.save("colour_2", self.colours[1])
+        elif breath_type == "triple":
+            self._rzone.breath_triple(rgb[0][0], rgb[0][1], rgb[0][2],
+                                      rgb[1][0], rgb[1][1], rgb[1][2],
+                                      rgb[2][0], rgb[2][1], rgb[2][2])
+            self._persistence.save("effect", "breathTriple")
+            self._persistence.save("colour_1", self.colours[0])
+            self._persistence.save("colour_2", self.colours[1])
+            self._persistence.save("colour_3", self.colours[2])
+        else:
+            raise KeyError("Unknown breath type: " + breath_type)
+
+
+class StarlightOption(Backend.EffectOption):
+    __slots__ = ("_rzone", "_persistence")
+
+    def __init__(self, rzone, persistence):
+        super().__init__()
+        self._rzone = rzone
+        self._persistence = persistence
+        self.uid = "starlight"
+        self.colours = self._persistence.state["colours"]
+
+    def refresh(self):
+        current_effect = self._persistence.state["effect"]
+        if not current_effect.startswith("starlight"):
+            self.active = False
+            return
+        self.active = True
+        current_starlight = current_effect.split("starlight")[1].lower()
+        current_speed = self._persistence.state["speed"]
+        for param in self.parameters:
+            param.active = False
+            starlight_type, starlight_speed = param.data.split(":")
+            if current_starlight == starlight_type and str(current_speed) == starlight_speed:
+                param.active = True
+        self.colours = self._persistence.state["colours"]
+
+    def apply(self, data):
+        # Param Example: "random:2" for a Medium (2) Random Starlight
+        starlight_type = data.split(":")[0]
+        starlight_speed = int(data.split(":")[1])
+
+        rgb = []
+        for colour in self.colours:
+            rgb.append(common.hex_to_rgb(colour))
+
+        if starlight_type == "random":
+            self._rzone.starlight_random(starlight_speed)
+            self._persistence.save("effect", "starlightRandom")
+        elif starlight_type == "single":
+            self._rzone.starlight_single(rgb[0][0], rgb[0][1], rgb[0][2], starlight_speed)
+            self._persistence.save("colour_1", self.colours[0])
+            self._persistence.save("effect", "starlightSingle")
+        elif starlight_type == "dual":
+            self._rzone.starlight_dual(rgb[0][0], rgb[0][1], rgb[0][2],
+                                       rgb[1][0], rgb[1][1], rgb[1][2], starlight_speed)
+            self._persistence.save("colour_1", self.colours[0])
+            self._persistence.save("colour_2", self.colours[1])
+            self._persistence.save("effect", "starlightDual")
+        else:
+            raise KeyError("Unknown starlight parameter:" + str(data))
+        self._persistence.save("speed", starlight_speed)
+
+
+class IdleTimeOptionSetOnly(Backend.SliderOption):
+    __slots__ = ("_rdevice", "_persistence")
+
+    def __init__(self, rdevice, persistence):
+        # Device stores idle time in seconds. Present as minutes.
+        super().__init__()
+        self._rdevice = rdevice
+        self._persistence = persistence
+        self.uid = "idle_time"
+        self.min = 1
+        self.max = 15
+
+    def refresh(self):
+        self.value = int(int(self._persistence.get("idle_time")) / 60)
+
+    def apply(self, new_value):
+        self._rdevice.set_idle_time(int(new_value) * 60)
+        self._persistence.save("idle_time", int(new_value) * 60)
+
+
+class IdleTimeOptionSetGet(IdleTimeOptionSetOnly):
+    __slots__ = ()
+
+    def refresh(self):
+        self.value = int(self._rdevice.get_idle_time() / 60)
+
+
+class LowBatteryThresholdOptionSetOnly(Backend.SliderOption):
+    __slots__ = ("_rdevice", "_persistence")
+
+    def __init__(self, rdevice, persistence):
+        super().__init__()
+        self._rdevice = rdevice
+        self._persistence = persistence
+        self.uid = "low_battery_threshold"
+        self.min = 1
+        self.max = 100
+        self.suffix = "%"
+        self.suffix_plural = "%"
+
+    def refresh(self):
+        self.value = int(self._persistence.get("low_battery_threshold"))
+
+    def apply(self, new_value):
+        self._rdevice.set_low_battery_threshold(int(new_value))
+        self._persistence.save("low_battery_threshold", int(new_value))
+
+
+class LowBatteryThresholdOptionSetGet(LowBatteryThresholdOptionSetOnly):
+    __slots__ = ()
+
+    def refresh(self):
+        self.value = int(self._rdevice.get_low_battery_threshold())
+
+
 class OpenRazerPersistence(object):
     """
     Use OpenRazer's persistence API introduced in v3.0.0. Each 'fx' zone contains
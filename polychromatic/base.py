@@ -11,7 +11,6 @@ from .paths import Paths as Paths
 from . import common as common_class
 from . import preferences as preferences_class
 
-import os
 
 
 class PolychromaticBase(object):
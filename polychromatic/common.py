@@ -9,13 +9,9 @@ import hashlib
 import os
 import sys
 import subprocess
-import grp
-import time
 import traceback
 from threading import Thread
 
-from . import base
-from . import locales
 
 # TODO: Refactor later!
 paths = None
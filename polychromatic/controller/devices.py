@@ -7,34 +7,105 @@ This module controls the 'Devices' tab of the Controller GUI.
 from polychromatic.procpid import DeviceSoftwareState
 from .. import bulkapply
 from .. import common
-from .. import effects
-from .. import locales
-from .. import preferences as pref
-from .. import middleman
 from . import shared
 from ..backends._backend import Backend as Backend
 from ..qt.flowlayout import FlowLayout as QFlowLayout
 
 import os
+import queue
 import subprocess
 import time
 import shutil
 import webbrowser
 
-from PyQt5.QtCore import Qt, QSize, QMargins, QThread
-from PyQt5.QtGui import QIcon, QPixmap, QFont
-from PyQt5.QtWidgets import QWidget, QDialogButtonBox, QGroupBox, QGridLayout, \
-                            QPushButton, QToolButton, QMessageBox, QListWidget, \
+from PyQt5.QtCore import Qt, QSize, QMargins, QThread, QTimer, pyqtSignal
+from PyQt5.QtGui import QIcon
+from PyQt5.QtWidgets import QWidget, QDialogButtonBox, QPushButton, QToolButton, \
                             QTreeWidget, QTreeWidgetItem, QLabel, QComboBox, \
-                            QSpacerItem, QSizePolicy, QSlider, QCheckBox, \
-                            QButtonGroup, QRadioButton, QDialog, QTableWidget, \
-                            QTableWidgetItem, QAction, QHBoxLayout
+                            QSizePolicy, QSlider, QCheckBox, QButtonGroup, \
+                            QRadioButton, QDialog, QTableWidget, QTableWidgetItem, \
+                            QAction, QApplication, QHBoxLayout
 
 # Error codes
 ERROR_NO_DEVICE = 0
 ERROR_BACKEND_IMPORT = 1
 ERROR_NO_BACKEND = 2
 
+# QIcons previously constructed for this session, keyed by icon path.
+# Options/parameters reuse the same few icons, so build each one once
+# instead of re-reading the file every time a device page is opened.
+_qicon_cache = {}
+
+
+# Parsed custom DPI stage files, keyed by path. The file's mtime is stored
+# alongside so edits (e.g. via the DPI editor dialog) invalidate the entry.
+_dpi_stage_cache = {}
+
+
+def read_dpi_stages_file(path):
+    """
+    Returns the list of [X,Y] DPI stages saved in the specified .list file.
+    Results are memoized until the file changes on disk.
+    """
+    mtime = os.path.getmtime(path)
+    cached = _dpi_stage_cache.get(path)
+    if cached and cached[0] == mtime:
+        return cached[1]
+
+    values = []
+    with open(path, "r") as f:
+        for line in f.readlines():
+            try:
+                dpi_x, dpi_y = line.split(",")
+                values.append([int(dpi_x), int(dpi_y)])
+            except ValueError:
+                # TODO: Output to stderr
+                pass
+
+    _dpi_stage_cache[path] = (mtime, values)
+    return values
+
+
+def get_cached_qicon(path):
+    """
+    Returns a QIcon for the specified path, reusing an existing instance
+    where one was already created this session.
+    """
+    try:
+        return _qicon_cache[path]
+    except KeyError:
+        icon = QIcon(path)
+        _qicon_cache[path] = icon
+        return icon
+
+
+class ApplyOptionThread(QThread):
+    """
+    Applies options in the background so slow backend writes do not block
+    the interface. Requests are queued and processed one at a time, so the
+    hardware never receives interleaved writes.
+    """
+    option_failed = pyqtSignal(object)
+
+    def __init__(self):
+        super().__init__()
+        self.queue = queue.Queue()
+
+    def run(self):
+        while True:
+            request = self.queue.get()
+            if request is None:
+                return
+            option, data = request
+            try:
+                option.apply(data)
+            except Exception as e:
+                self.option_failed.emit(e)
+
+    def stop(self):
+        self.queue.put(None)
+        self.wait()
+
 
 class DevicesTab(shared.TabData):
     """
@@ -47,14 +118,16 @@ class DevicesTab(shared.TabData):
         # Session
         self.current_device = None
         self.load_thread = None
+        self.apply_thread = None
 
         # UI Elements
         self.Contents = self.main_window.findChild(QWidget, "DeviceContents")
         self.SidebarTree = self.main_window.findChild(QTreeWidget, "DeviceSidebarTree")
         self.SidebarTree.itemClicked.connect(self._sidebar_changed)
 
-        # Useful complimentary software
-        self.input_remapper = shutil.which("input-remapper-gtk")
+        # Useful complimentary software. Resolved on first use, so opening
+        # the application doesn't stall scanning PATH.
+        self.input_remapper = None
 
         # Avoid garbage collection cleaning up invisible controls
         self.btn_grps = {}
@@ -95,7 +168,7 @@ class DevicesTab(shared.TabData):
         for device in device_list:
             item = QTreeWidgetItem()
             item.setText(0, device.name)
-            item.setIcon(0, QIcon(device.form_factor["icon"]))
+            item.setIcon(0, get_cached_qicon(device.form_factor["icon"]))
             item.section = "device"
             item.device_item = device
             devices_branch.addChild(item)
@@ -105,7 +178,7 @@ class DevicesTab(shared.TabData):
         for device in unknown_device_list:
             item = QTreeWidgetItem()
             item.setText(0, device.name)
-            item.setIcon(0, QIcon(device.form_factor["icon"]))
+            item.setIcon(0, get_cached_qicon(device.form_factor["icon"]))
             item.section = "device-unknown"
             item.device_item = device
             devices_branch.addChild(item)
@@ -287,6 +360,10 @@ class DevicesTab(shared.TabData):
             self.middleman.invalidate_cache()
             return self.set_tab()
 
+        # Suspend painting while the page is built, so each addWidget doesn't
+        # trigger its own relayout and repaint.
+        self.Contents.setUpdatesEnabled(False)
+
         layout.addWidget(self._get_device_summary_widget(device))
 
         for zone in device.zones:
@@ -360,7 +437,7 @@ class DevicesTab(shared.TabData):
                     widgets.append(self.special_controls.create_openrazer_macro_control())
 
                 # -- Information about programmable keys
-                if device.has_programmable_keys and self.input_remapper:
+                if device.has_programmable_keys and self._get_input_remapper():
                     widgets.append(self.special_controls.create_programmable_keys_control(self.input_remapper))
 
             # Before adding to the main layout, use group boxes if there's multiple zones
@@ -374,6 +451,7 @@ class DevicesTab(shared.TabData):
                     layout.addWidget(widget)
 
         layout.addStretch()
+        self.Contents.setUpdatesEnabled(True)
         self.set_cursor_normal()
 
     def reload_device(self):
@@ -382,6 +460,27 @@ class DevicesTab(shared.TabData):
         """
         self.open_device(self.current_device)
 
+    def _apply_option(self, option, data):
+        """
+        Apply an option on the background thread. Errors are reported back
+        to the user on the GUI thread.
+        """
+        if not self.apply_thread:
+            self.apply_thread = ApplyOptionThread()
+            self.apply_thread.option_failed.connect(lambda e: self._catch_command_error(self.current_device, e))
+            QApplication.instance().aboutToQuit.connect(self.apply_thread.stop)
+            self.apply_thread.start()
+        self.apply_thread.queue.put((option, data))
+
+    def _get_input_remapper(self):
+        """
+        Returns the path to the input-remapper GUI, or an empty string when it
+        is not installed. Only looked up when a device page needs it.
+        """
+        if self.input_remapper is None:
+            self.input_remapper = shutil.which("input-remapper-gtk") or ""
+        return self.input_remapper
+
     def _create_row_control(self, option):
         """
         Returns a list of widgets for the specified option.
@@ -411,27 +510,42 @@ class DevicesTab(shared.TabData):
         slider.setTickPosition(QSlider.TicksBelow)
         slider.setTickInterval(int(option.max / 10))
 
+        # Pre-pick the suffixes; the singular form only ever applies to "1".
+        # The label updates for every value while dragging.
+        singular_label = "1" + option.suffix
+        plural_suffix = option.suffix_plural
+
         label = QLabel()
-        suffix = option.suffix if option.value == 1 else option.suffix_plural
-        label.setText(str(option.value) + suffix)
+        label.setText(singular_label if option.value == 1 else f"{option.value}{plural_suffix}")
 
         # Change label while sliding
         def _slider_moved(value):
-            suffix = option.suffix if value == 1 else option.suffix_plural
-            label.setText(str(value) + suffix)
+            label.setText(singular_label if value == 1 else f"{value}{plural_suffix}")
         slider.sliderMoved.connect(_slider_moved)
         slider.valueChanged.connect(_slider_moved)
 
         # Send request once dropped
         def _slider_dropped():
             self.dbg.stdout(f"{self.current_device.name}: Applying option {option.uid} with value: {str(slider.value())}", self.dbg.action, 1)
-            try:
-                option.apply(slider.value())
-            except Exception as e:
-                self._catch_command_error(self.current_device, e)
+            self._apply_option(option, slider.value())
+
+        # valueChanged fires for every step while dragging or scrolling, so
+        # coalesce those into one apply() shortly after the value settles.
+        # Releasing the handle still applies immediately.
+        apply_timer = QTimer()
+        apply_timer.setSingleShot(True)
+        apply_timer.setInterval(50)
+        apply_timer.timeout.connect(_slider_dropped)
 
-        slider.sliderReleased.connect(_slider_dropped)
-        slider.valueChanged.connect(_slider_dropped)
+        def _slider_released():
+            apply_timer.stop()
+            _slider_dropped()
+
+        slider.sliderReleased.connect(_slider_released)
+        slider.valueChanged.connect(lambda new_value: apply_timer.start())
+
+        # Keep a reference so the timer isn't garbage collected
+        slider.apply_timer = apply_timer
 
         return [slider, label]
 
@@ -447,10 +561,7 @@ class DevicesTab(shared.TabData):
         def _state_changed():
             onoff = "on" if checkbox.isChecked() else "off"
             self.dbg.stdout(f"{self.current_device.name}: Turning {onoff} option {option.uid}", self.dbg.action, 1)
-            try:
-                option.apply(checkbox.isChecked())
-            except Exception as e:
-                self._catch_command_error(self.current_device, e)
+            self._apply_option(option, checkbox.isChecked())
 
         checkbox.stateChanged.connect(_state_changed)
         return [checkbox]
@@ -467,7 +578,7 @@ class DevicesTab(shared.TabData):
         for index, param in enumerate(params):
             combo.addItem(param.label)
             if param.icon:
-                combo.setItemIcon(combo.count() - 1, QIcon(param.icon))
+                combo.setItemIcon(combo.count() - 1, get_cached_qicon(param.icon))
             if param.active:
                 selected_index = index
 
@@ -476,10 +587,7 @@ class DevicesTab(shared.TabData):
         def _current_index_changed(index):
             param = params[index]
             self.dbg.stdout(f"{self.current_device.name}: Setting option {option.uid} to {param.data}", self.dbg.action, 1)
-            try:
-                option.apply(param.data)
-            except Exception as e:
-                self._catch_command_error(self.current_device, e)
+            self._apply_option(option, param.data)
 
         combo.currentIndexChanged.connect(_current_index_changed)
         return [combo]
@@ -499,7 +607,7 @@ class DevicesTab(shared.TabData):
             button.setIconSize(QSize(40, 40))
             button.setToolButtonStyle(Qt.ToolButtonTextUnderIcon)
             if option.icon:
-                button.setIcon(QIcon(option.icon))
+                button.setIcon(get_cached_qicon(option.icon))
             button.setMinimumHeight(70)
             button.setMinimumWidth(105)
             button.option = option
@@ -563,7 +671,7 @@ class DevicesTab(shared.TabData):
                 radio.setChecked(True)
 
             if param.icon:
-                radio.setIcon(QIcon(param.icon))
+                radio.setIcon(get_cached_qicon(param.icon))
                 radio.setIconSize(QSize(22, 22))
             return radio
 
@@ -915,7 +1023,7 @@ class DevicesTab(shared.TabData):
             button.setText(option.label)
             button.setIconSize(QSize(40, 40))
             button.setToolButtonStyle(Qt.ToolButtonTextUnderIcon)
-            button.setIcon(QIcon(option.icon))
+            button.setIcon(get_cached_qicon(option.icon))
             button.setMinimumHeight(70)
             button.setMinimumWidth(105)
             button.option = option
@@ -1324,18 +1432,9 @@ class SpecialControls(shared.TabData):
         stages = device.dpi.default_stages
 
         # Use custom stages if the user saved them for this device
-        # TODO: Should reuse this code
         dpi_file = os.path.join(self.paths.dpi, device.name + ".list")
         if os.path.exists(dpi_file):
-            values = []
-            with open(dpi_file, "r") as f:
-                for line in f.readlines():
-                    try:
-                        dpi_x, dpi_y = line.split(",")
-                        values.append([int(dpi_x), int(dpi_y)])
-                    except ValueError:
-                        # TODO: Output to stderr
-                        pass
+            values = read_dpi_stages_file(dpi_file)
             if values:
                 stages = values
 
@@ -1579,17 +1678,7 @@ class DPIStageEditor(shared.TabData):
         """
         Load saved DPI data from disk.
         """
-        # TODO: Should reuse this code
-        values = []
-        with open(self.dpi_file, "r") as f:
-            for line in f.readlines():
-                try:
-                    dpi_x, dpi_y = line.split(",")
-                    values.append([int(dpi_x), int(dpi_y)])
-                except ValueError:
-                    # TODO: Output to stderr
-                    pass
-        self._update_dpi_table(values)
+        self._update_dpi_table(read_dpi_stages_file(self.dpi_file))
 
     def stage_add(self):
         """
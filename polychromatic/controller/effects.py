@@ -6,21 +6,13 @@ This module controls the 'Effects' tab of the Controller GUI.
 
 from .. import common
 from .. import effects
-from .. import locales
 from .. import procpid
-from .. import preferences as pref
 from . import shared
-from . import editor
 
-import os
-
-from PyQt5.QtCore import Qt
-from PyQt5.QtGui import QIcon, QPixmap
-from PyQt5.QtWidgets import QWidget, QPushButton, QToolButton, QMessageBox, \
-                            QListWidget, QTreeWidget, QLabel, QComboBox, \
-                            QTreeWidgetItem, QMenu, QDialog, QDialogButtonBox, \
-                            QButtonGroup, QLineEdit, QTextEdit, QCheckBox, \
-                            QGroupBox, QRadioButton, QMainWindow
+from PyQt5.QtGui import QIcon
+from PyQt5.QtWidgets import QPushButton, QToolButton, QMessageBox, QLabel, \
+                            QComboBox, QDialog, QDialogButtonBox, QLineEdit, \
+                            QTextEdit, QGroupBox, QRadioButton
 
 
 class EffectsTab(shared.CommonFileTab):
@@ -373,6 +365,9 @@ class EffectsTab(shared.CommonFileTab):
                 return
 
         if effect_type in [effects.TYPE_LAYERED, effects.TYPE_SEQUENCE]:
+            # Deferred import: the editor pulls in QtWebEngine, which is
+            # expensive to load and unnecessary until an effect is edited.
+            from . import editor
             self.editors[effect_path] = editor.VisualEffectEditor(self.appdata, self.fileman, effect_path)
 
     def import_effect(self):
@@ -380,7 +375,6 @@ class EffectsTab(shared.CommonFileTab):
         Allows the user to create effects from other media, such as videos or images.
         """
         print("stub:effects.import_effect")
-        pass
 
     def play_effect(self, device_name=None):
         """
@@ -5,7 +5,6 @@ This module contains the events when clicking on interactive menu bar components
 """
 
 import os
-import time
 import subprocess
 import webbrowser
 
@@ -17,12 +16,11 @@ from . import shared
 from . import procviewer
 from . import troubleshooter
 
-from PyQt5.QtCore import Qt, QThread
-from PyQt5.QtGui import QBrush, QPixmap, QFont, QIcon
-from PyQt5.QtWidgets import QWidget, QMenuBar, QMenu, QAction, QLabel, QDialog, \
-                            QPushButton, QTreeWidget, QTreeWidgetItem, \
-                            QTextEdit, QButtonGroup, QProgressBar, QMessageBox, \
-                            QApplication
+from PyQt5.QtCore import Qt
+from PyQt5.QtGui import QIcon
+from PyQt5.QtWidgets import QWidget, QMenuBar, QAction, QLabel, QDialog, QPushButton, \
+                            QTreeWidget, QTreeWidgetItem, QTextEdit, \
+                            QButtonGroup, QMessageBox
 
 
 class MenuBar(PolychromaticBase):
@@ -41,41 +39,45 @@ class MenuBar(PolychromaticBase):
         self.openrazer = MenuBarOpenRazer(appdata, self.widgets)
 
         # Bind global menu bar items to their events
-        # -- File
-        self._bind_item("actionNewEffect", self.new_effect)
-        self._bind_item("actionImportEffect", self.import_effect)
-        self._bind_item("actionNewPreset", self.new_preset)
-        self._bind_item("actionNewPresetNow", self.new_preset_now)
-
-        # -- View
-        self._bind_item("actionHideMenuBar", self.hide_menu_bar)
-        self._bind_item("actionReinstateMenuBar", self.reinstate_menu_bar)
-        self._bind_item("actionForceRefresh", self.force_refresh)
-        self._bind_item("actionPreferences", self.open_preferences)
-
-        # -- Tools
-        self._bind_item("actionRestartTrayApplet", self.restart_tray_applet)
-        self._bind_item("actionProcessViewer", self.open_process_viewer)
-
-        # -- Tools > OpenRazer
-        self._bind_item("actionOpenRazerWebsite", self.openrazer.website)
-        self._bind_item("actionOpenRazerReportBug", self.openrazer.report_bug)
-        self._bind_item("actionOpenRazerReleaseNotes", self.openrazer.release_notes)
-        self._bind_item("actionOpenRazerConfigure", self.openrazer.configure)
-        self._bind_item("actionOpenRazerOpenLog", self.openrazer.open_log)
-        self._bind_item("actionOpenRazerRestartDaemon", self.openrazer.restart_daemon)
-        self._bind_item("actionOpenRazerAbout", self.openrazer.about)
-
-        # -- Tools > Troubleshooter
-        self._bind_item("actionTroubleshootOpenRazer", self.openrazer.troubleshoot)
-
-        # -- Help
-        self._bind_item("actionOnlineHelp", self.online_help)
-        self._bind_item("actionWebsite", self.polychromatic_website)
-        self._bind_item("actionReleaseNotes", self.polychromatic_release_notes)
-        self._bind_item("actionReportBug", self.polychromatic_report_bug)
-        self._bind_item("actionDonate", self.polychromatic_donate)
-        self._bind_item("actionAbout", self.about_polychromatic)
+        bindings = (
+            # -- File
+            ("actionNewEffect", self.new_effect),
+            ("actionImportEffect", self.import_effect),
+            ("actionNewPreset", self.new_preset),
+            ("actionNewPresetNow", self.new_preset_now),
+
+            # -- View
+            ("actionHideMenuBar", self.hide_menu_bar),
+            ("actionReinstateMenuBar", self.reinstate_menu_bar),
+            ("actionForceRefresh", self.force_refresh),
+            ("actionPreferences", self.open_preferences),
+
+            # -- Tools
+            ("actionRestartTrayApplet", self.restart_tray_applet),
+            ("actionProcessViewer", self.open_process_viewer),
+
+            # -- Tools > OpenRazer
+            ("actionOpenRazerWebsite", self.openrazer.website),
+            ("actionOpenRazerReportBug", self.openrazer.report_bug),
+            ("actionOpenRazerReleaseNotes", self.openrazer.release_notes),
+            ("actionOpenRazerConfigure", self.openrazer.configure),
+            ("actionOpenRazerOpenLog", self.openrazer.open_log),
+            ("actionOpenRazerRestartDaemon", self.openrazer.restart_daemon),
+            ("actionOpenRazerAbout", self.openrazer.about),
+
+            # -- Tools > Troubleshooter
+            ("actionTroubleshootOpenRazer", self.openrazer.troubleshoot),
+
+            # -- Help
+            ("actionOnlineHelp", self.online_help),
+            ("actionWebsite", self.polychromatic_website),
+            ("actionReleaseNotes", self.polychromatic_release_notes),
+            ("actionReportBug", self.polychromatic_report_bug),
+            ("actionDonate", self.polychromatic_donate),
+            ("actionAbout", self.about_polychromatic),
+        )
+        for object_name, function in bindings:
+            self._bind_item(object_name, function)
 
         self._load_icons()
 
@@ -137,15 +139,12 @@ class MenuBar(PolychromaticBase):
 
     def import_effect(self):
         self.appdata.tab_effects.import_effect()
-        pass
 
     def new_preset(self):
         print("stub:menubar.new_preset")
-        pass
 
     def new_preset_now(self):
         print("stub:menubar.new_preset_now")
-        pass
 
     def hide_menu_bar(self):
         """
@@ -5,10 +5,6 @@ This module controls the 'Preferences' window of the Controller GUI.
 """
 
 from ..base import PolychromaticBase
-from .. import common
-from .. import effects
-from .. import locales
-from .. import middleman
 from .. import procpid
 from .. import preferences as pref
 from . import shared
@@ -16,12 +12,10 @@ from . import shared
 import os
 import configparser
 
-from PyQt5.QtCore import Qt
-from PyQt5.QtGui import QIcon, QPixmap
-from PyQt5.QtWidgets import QWidget, QPushButton, QTreeWidget, QLabel, \
-                            QComboBox, QCheckBox, QDialog, QSpinBox, \
-                            QDoubleSpinBox, QDialogButtonBox, QTabWidget, \
-                            QMessageBox, QAction, QToolButton
+from PyQt5.QtGui import QIcon
+from PyQt5.QtWidgets import QPushButton, QLabel, QComboBox, QCheckBox, \
+                            QDialog, QSpinBox, QDoubleSpinBox, QDialogButtonBox, \
+                            QTabWidget, QMessageBox, QAction
 
 
 class PreferencesWindow(shared.TabData):
@@ -4,14 +4,8 @@
 This module controls the 'Presets' tab of the Controller GUI.
 """
 
-from .. import common
-from .. import effects
-from .. import locales
-from .. import preferences as pref
 from . import shared
 
-from PyQt5.QtWidgets import QWidget, QPushButton, QToolButton, QMessageBox, \
-                            QListWidget, QTreeWidget, QLabel, QComboBox
 
 
 class PresetsTab(shared.TabData):
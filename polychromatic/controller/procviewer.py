@@ -9,15 +9,11 @@ from .. import common
 from .. import procpid
 from . import shared
 
-import glob
-import os
 import time
-import subprocess
 
-from PyQt5.QtCore import Qt, QThread
-from PyQt5.QtGui import QIcon, QPixmap
-from PyQt5.QtWidgets import QWidget, QDialog, QPushButton, QTreeWidget, \
-                            QLabel, QTreeWidgetItem
+from PyQt5.QtCore import QThread
+from PyQt5.QtGui import QIcon
+from PyQt5.QtWidgets import QDialog, QPushButton, QTreeWidget, QTreeWidgetItem
 
 
 class ProcessViewer(PolychromaticBase):
@@ -6,7 +6,6 @@ This module contains widgets shared across the Controller GUI.
 
 from ..base import PolychromaticBase
 from .. import common
-from .. import locales
 from .. import preferences as pref
 from .. import procpid
 from .. import fileman
@@ -19,18 +18,16 @@ import glob
 import requests
 import shutil
 
-from PyQt5 import uic, QtSvg
+from PyQt5 import uic
 from PyQt5.QtCore import Qt, QSize, QMargins
 from PyQt5.QtGui import QIcon, QPalette, QColor, QFont, QPixmap, QMovie
 from PyQt5.QtSvg import QSvgWidget
-from PyQt5.QtWebEngineWidgets import QWebEngineView
-from PyQt5.QtWidgets import QApplication, QMainWindow, QMenuBar, \
-                            QWidget, QMessageBox, QGridLayout, \
-                            QLabel, QPushButton, QToolButton, QGroupBox, \
-                            QListWidget, QHBoxLayout, QVBoxLayout, QFormLayout, \
-                            QSizePolicy, QSpacerItem, QDialog, QColorDialog, \
-                            QDialogButtonBox, QTreeWidget, QTreeWidgetItem, \
-                            QLineEdit, QTextEdit, QTabWidget, QScrollArea, \
+from PyQt5.QtWidgets import QMainWindow, QMenuBar, QWidget, \
+                            QMessageBox, QGridLayout, QLabel, \
+                            QPushButton, QToolButton, QGroupBox, QHBoxLayout, \
+                            QVBoxLayout, QFormLayout, QSizePolicy, QDialog, \
+                            QColorDialog, QDialogButtonBox, QTreeWidget, QTreeWidgetItem, \
+                            QLineEdit, QTextEdit, QTabWidget, \
                             QButtonGroup, QFileDialog, QMenu, QAction, \
                             QDockWidget, QCheckBox, QSpinBox, QComboBox, \
                             QTreeWidget, QDoubleSpinBox, QRadioButton, QToolBar
@@ -241,18 +238,33 @@ def set_pixmap_for_label(qlabel, icon_path, icon_size=24):
     qlabel.setSizePolicy(QSizePolicy.Minimum, QSizePolicy.Minimum)
 
 
+# Paths previously resolved by get_real_device_image() for this session.
+# The files themselves live under paths.devices, persisting across launches.
+_device_image_cache = {}
+
+
 def get_real_device_image(uri):
     """
     Returns the path to the image that physically represents a device. If the
     URI is HTTP(S), this will be downloaded and cached locally.
+
+    Successful lookups are memoized so switching between devices/tabs doesn't
+    repeatedly hash the URI and stat the filesystem.
     """
+    try:
+        return _device_image_cache[uri]
+    except KeyError:
+        pass
+
     if os.path.exists(uri):
+        _device_image_cache[uri] = uri
         return uri
 
     cache_key = hashlib.md5(uri.encode("UTF-8")).hexdigest()
     cache_path = os.path.join(PolychromaticBase.paths.devices, cache_key)
 
     if os.path.exists(cache_path):
+        _device_image_cache[uri] = cache_path
         return cache_path
 
     if not PolychromaticBase.preferences.get("controller", {}).get("download_device_images", True):
@@ -269,6 +281,7 @@ def get_real_device_image(uri):
             PolychromaticBase.dbg.stdout("Retrieved image: " + uri, PolychromaticBase.dbg.action, 1)
             with open(cache_path, "wb") as f:
                 f.write(r.content)
+            _device_image_cache[uri] = cache_path
             return cache_path
         else:
             PolychromaticBase.dbg.stdout(f"Connection error while downloading: {uri}\nHTTP Status {str(r.status_code)}", PolychromaticBase.dbg.warning, 1)
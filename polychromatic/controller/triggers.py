@@ -4,13 +4,8 @@
 This module controls the 'Triggers' tab of the Controller GUI.
 """
 
-from .. import common
-from .. import effects
-from .. import locales
-from .. import preferences as pref
 from . import shared
 
-from PyQt5.QtWidgets import QWidget, QPushButton, QToolButton, QMessageBox, QListWidget, QTreeWidget, QLabel, QComboBox
 
 class TriggersTab(shared.TabData):
     """
@@ -4,22 +4,15 @@
 This module contains the frontend for the troubleshooter.
 """
 
-import os
 import time
-import subprocess
-import webbrowser
 
 from .. import common
-from .. import preferences
-from .. import procpid
 from . import shared
-from . import procviewer
 
-from PyQt5.QtCore import Qt, QThread, pyqtSignal, pyqtSlot, QObject
+from PyQt5.QtCore import Qt, QThread, pyqtSignal, QObject
 from PyQt5.QtGui import QIcon, QBrush
-from PyQt5.QtWidgets import QWidget, QLabel, QDialog, QPushButton, \
-                            QTreeWidget, QTreeWidgetItem, QProgressBar, \
-                            QApplication
+from PyQt5.QtWidgets import QLabel, QDialog, QPushButton, QTreeWidget, \
+                            QTreeWidgetItem, QProgressBar, QApplication
 
 
 class TroubleshooterGUI(QObject):
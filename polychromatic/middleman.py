@@ -9,14 +9,36 @@ Refer to the online documentation for more details:
 https://docs.polychromatic.app/
 """
 
+import concurrent.futures
+import importlib
+import os
+import threading
+import time
+
 from . import procpid
 from . import common
 from .backends._backend import Backend
-from .troubleshoot import openrazer as openrazer_troubleshoot
+
+
+# Backend IDs mapping to the module and class implementing them. The modules
+# are only imported during init() as they may pull in heavy dependencies
+# (e.g. D-Bus libraries) that shouldn't slow down importing this module.
+BACKEND_MODULES = {
+    "openrazer": ("polychromatic.backends.openrazer", "OpenRazerBackend"),
+}
+
+
+def _openrazer_troubleshooter(*args, **kwargs):
+    """
+    Run the OpenRazer troubleshooter, deferring its import (and that of the
+    diagnostic modules it pulls in) until the user actually runs one.
+    """
+    from .troubleshoot import openrazer as openrazer_troubleshoot
+    return openrazer_troubleshoot.troubleshoot(*args, **kwargs)
 
 
 TROUBLESHOOT_MODULES = {
-    "openrazer": openrazer_troubleshoot.troubleshoot
+    "openrazer": _openrazer_troubleshooter
 }
 
 
@@ -35,6 +57,9 @@ class Middleman(object):
         # List of initialized Backend() objects.
         self.backends = []
 
+        # Dictionary mapping backend IDs to initialized Backend() objects.
+        self._backend_by_id = {}
+
         # List of Backend() modules that failed to init().
         self.bad_init = []
 
@@ -43,92 +68,148 @@ class Middleman(object):
 
         # Dictionary of backend IDs referencing troubleshoot() functions, if available.
         #   e.g. "openrazer": TROUBLESHOOT_MODULES.get("openrazer")
-        self.troubleshooters = {}
+        self.troubleshooters = dict(TROUBLESHOOT_MODULES)
 
         # Keys containing human readable strings for modules that failed to import.
         #   e.g. "openrazer": "Exception: xyz"
         self.import_errors = {}
 
+        # Handlers for re-applying options without parameters, keyed by type.
+        # Memoized per concrete subclass so hot UI callbacks skip isinstance chains.
+        self._apply_dispatch = {
+            Backend.EffectOption: lambda option: option.apply(),
+            Backend.ToggleOption: lambda option: option.apply(option.active),
+            Backend.SliderOption: lambda option: option.apply(option.value),
+            Backend.MultipleChoiceOption: lambda option: option.apply(),
+        }
+
         # List of DeviceItem() objects.
         self.device_cache = []
 
+        # Serialises cache reloads so a foreground query waits on (and then
+        # reuses) a refresh already in flight, e.g. the init() warm up.
+        self._cache_lock = threading.Lock()
+
+        # Device cache entries live for a few seconds. Queries within this
+        # window reuse the list instead of re-enumerating every backend.
+        self._cache_ttl = 2.0
+        self._cache_expiry = 0.0
+
+        # Indexes into device_cache for O(1) lookups, built alongside it.
+        self._devices_by_form_factor = {}
+        self._devices_by_name = {}
+        self._devices_by_serial = {}
+
+        # Memoized procpid objects keyed by device serial, sparing repeated
+        # pidfile/state file reads on frequently used paths.
+        self._procmgr_cache = {}
+        self._swstate_cache = {}
+
     def init(self):
         """
         Initialise the backend objects. This should be called when the user interface
         is ready. Note that this thread may potentially be blocked if the backend
         hangs while it initialises.
         """
-        # Just OpenRazer for now.
+        # Backends initialise independently, so a slow one (e.g. waiting on
+        # its daemon) won't hold up the others.
+        with concurrent.futures.ThreadPoolExecutor(max_workers=len(BACKEND_MODULES)) as executor:
+            for backend_id, (module_path, class_name) in BACKEND_MODULES.items():
+                executor.submit(self._init_backend, backend_id, module_path, class_name)
+
+        self._backend_by_id = {backend.backend_id: backend for backend in self.backends}
+
+        # Warm the device cache in the background so the first query from the
+        # interface doesn't block on a cold enumeration.
+        threading.Thread(target=self._reload_device_cache_if_empty, daemon=True).start()
+
+    def _init_backend(self, backend_id, module_path, class_name):
+        """
+        Import and initialise a single backend, recording the outcome.
+        """
         try:
-            import polychromatic.backends.openrazer as openrazer_backend
-            backend = openrazer_backend.OpenRazerBackend(self._base)
+            module = importlib.import_module(module_path)
+            backend = getattr(module, class_name)(self._base)
             if backend.init():
                 self.backends.append(backend)
             else:
                 self.bad_init.append(backend)
         except (ImportError, ModuleNotFoundError):
-            self.not_installed.append("openrazer")
+            self.not_installed.append(backend_id)
         except Exception as e:
-            self.import_errors["openrazer"] = common.get_exception_as_string(e)
-
-        try:
-            self.troubleshooters["openrazer"] = TROUBLESHOOT_MODULES["openrazer"]
-        except NameError:
-            # Backend does not have a troubleshooter.
-            pass
+            self.import_errors[backend_id] = common.get_exception_as_string(e)
 
     def get_backend(self, device):
         """
         Returns the backend object for the specified device.
         """
         # FIXME: Legacy code used this function for "backend_id"
-        if type(device) == str:
-            backend_id = device
-            for backend in self.backends:
-                if backend_id == backend.backend_id:
-                    return backend
+        if isinstance(device, str):
+            return self.get_backend_by_id(device)
+
+        return self.get_backend_for_device(device)
+
+    def get_backend_by_id(self, backend_id):
+        """
+        Returns the backend object for the specified backend ID, or None if
+        it is not running.
+        """
+        return self._backend_by_id.get(backend_id)
 
-        for module in self.backends:
-            if device.backend_id == module.backend_id:
-                return module
+    def get_backend_for_device(self, device):
+        """
+        Returns the backend object that owns the specified DeviceItem().
+        """
+        return self._backend_by_id.get(device.backend_id)
 
     def is_backend_running(self, backend_id):
         """
         Returns a boolean to indicate whether a specific backend ID is running
         and was successfully initialized.
         """
-        for module in self.backends:
-            if module.backend_id == backend_id:
-                return True
-        return False
+        return backend_id in self._backend_by_id
 
     def get_versions(self):
         """
         Return a dictionary of versions for each running backend.
         """
-        versions = {}
-        for module in self.backends:
-            versions[module.backend_id] = module.version
-        return versions
+        return {module.backend_id: module.version for module in self.backends}
 
     def _reload_device_cache_if_empty(self):
         """
-        Reload the cache of DeviceItem()'s if it hasn't been initalized yet.
+        Reload the cache of DeviceItem()'s if it hasn't been initalized yet,
+        or its entries have outlived their lifetime.
         """
-        if self.device_cache:
-            return
+        with self._cache_lock:
+            if self.device_cache:
+                if time.monotonic() < self._cache_expiry:
+                    return
+                self.invalidate_cache()
 
-        for backend in self.backends:
-            device_list = backend.get_devices()
+            # Enumeration is independent I/O-bound work per backend, so fan out
+            # and wait for the slowest rather than the sum of them all.
+            results = []
+            if self.backends:
+                with concurrent.futures.ThreadPoolExecutor(max_workers=len(self.backends)) as executor:
+                    futures = [executor.submit(backend.get_devices) for backend in self.backends]
+                results = zip(self.backends, futures)
 
-            if not type(device_list) == list:
-                continue
+            for backend, future in results:
+                device_list = future.result()
+
+                if not isinstance(device_list, list):
+                    continue
+
+                backend._attach_self_to_devices(device_list)
 
-            # Assign 'backend' variable into device object
-            for device in device_list:
-                device.backend = backend
+                for device in device_list:
+                    self._devices_by_form_factor.setdefault(device.form_factor["id"], []).append(device)
+                    self._devices_by_name[device.name] = device
+                    self._devices_by_serial[device.serial] = device
 
-            self.device_cache = self.device_cache + device_list
+                self.device_cache.extend(device_list)
+
+            self._cache_expiry = time.monotonic() + self._cache_ttl
 
     def invalidate_cache(self):
         """
@@ -136,12 +217,18 @@ class Middleman(object):
         or devices were inserted/removed.
         """
         self.device_cache = []
+        self._cache_expiry = 0.0
+        self._devices_by_form_factor = {}
+        self._devices_by_name = {}
+        self._devices_by_serial = {}
+        self._procmgr_cache = {}
+        self._swstate_cache = {}
 
     def reload_device_cache(self):
         """
         Clear the device object cache and reload.
         """
-        self.device_cache = []
+        self.invalidate_cache()
         self._reload_device_cache_if_empty()
 
     def get_devices(self):
@@ -153,9 +240,14 @@ class Middleman(object):
 
     def get_device_by_name(self, name):
         """
-        Returns a fresh DeviceItem() by looking up its device name, or None if
-        there is no device with that name.
+        Returns a DeviceItem() by looking up its device name, or None if
+        there is no device with that name. The cache is consulted first,
+        avoiding a backend query when the device is already known.
         """
+        device = self._devices_by_name.get(name)
+        if device:
+            return device
+
         for backend in self.backends:
             device = backend.get_device_by_name(name)
             if isinstance(device, Backend.DeviceItem):
@@ -164,9 +256,14 @@ class Middleman(object):
 
     def get_device_by_serial(self, serial):
         """
-        Returns a fresh DeviceItem() object by looking up its serial number, or
-        None if there is no device with that serial string.
+        Returns a DeviceItem() object by looking up its serial number, or
+        None if there is no device with that serial string. The cache is
+        consulted first, avoiding a backend query when the device is already known.
         """
+        device = self._devices_by_serial.get(serial)
+        if device:
+            return device
+
         for backend in self.backends:
             device = backend.get_device_by_serial(serial)
             if isinstance(device, Backend.DeviceItem):
@@ -178,25 +275,23 @@ class Middleman(object):
         Returns a list of DeviceItem()'s based on the form factor specified, or empty list.
         """
         self._reload_device_cache_if_empty()
-        devices = []
-        for device in self.device_cache:
-            if device.form_factor["id"] == form_factor_id:
-                devices.append(device)
-        return devices
+        return list(self._devices_by_form_factor.get(form_factor_id, []))
 
     def get_unsupported_devices(self):
         """
         Returns a list of connected devices that cannot be controlled by their backend.
         """
         unknown_devices = []
-        for backend in self.backends:
-            device_list = backend.get_unsupported_devices()
+        if not self.backends:
+            return unknown_devices
 
-            # Assign 'backend' variable into device object
-            for device in device_list:
-                device.backend = backend
+        with concurrent.futures.ThreadPoolExecutor(max_workers=len(self.backends)) as executor:
+            futures = [executor.submit(backend.get_unsupported_devices) for backend in self.backends]
 
-            unknown_devices = unknown_devices + device_list
+        for backend, future in zip(self.backends, futures):
+            device_list = future.result()
+            backend._attach_self_to_devices(device_list)
+            unknown_devices.extend(device_list)
         return unknown_devices
 
     def troubleshoot(self, backend, i18n, fn_progress_set_max, fn_progress_advance):
@@ -215,45 +310,45 @@ class Middleman(object):
             None            Troubleshooter not available
             False           Troubleshooter failed
         """
-        try:
-            return self.troubleshooters[backend](i18n, fn_progress_set_max, fn_progress_advance)
-        except KeyError:
+        troubleshooter = self.troubleshooters.get(backend)
+        if not troubleshooter:
             # Troubleshooter not available for this backend
             return None
+        return troubleshooter(i18n, fn_progress_set_max, fn_progress_advance)
         # TODO: Catch errors via interfaces
 
     def restart(self, backend):
         """
         Restarts a specific backend.
         """
-        for module in self.backends:
-            if module.backend_id == backend:
-                return module.restart()
+        module = self._backend_by_id.get(backend)
+        if module:
+            return module.restart()
 
     def get_active_effect(self, zone):
         """
         Return the first active Backend.EffectOption from the specified zone.
         """
-        for option in zone.options:
-            if isinstance(option, Backend.EffectOption) and option.active:
-                return option
+        return next((option for option in zone.options
+                     if isinstance(option, Backend.EffectOption) and option.active), None)
 
     def get_active_parameter(self, option):
         """
         Return the active Backend.Option.Parameter from the specified option.
         """
-        for param in option.parameters:
-            if param.active:
-                return param
+        return next((param for param in option.parameters if param.active), None)
 
     def get_active_colours_required(self, option):
         """
         Return the number of colours required for the specified option.
         When parameters are present, there may be a different number of colours.
         """
-        param = self.get_active_parameter(option)
-        if param:
-            return param.colours_required
+        if not option.parameters:
+            return option.colours_required
+
+        for param in option.parameters:
+            if param.active:
+                return param.colours_required
         return option.colours_required
 
     def get_default_parameter(self, option):
@@ -266,11 +361,7 @@ class Middleman(object):
         if not option.parameters:
             return None
 
-        for param in option.parameters:
-            if param.default:
-                return param
-
-        return option.parameters[0]
+        return next((param for param in option.parameters if param.default), option.parameters[0])
 
     def _apply_option_with_same_params(self, option):
         """
@@ -278,20 +369,52 @@ class Middleman(object):
         parameters and colours.
         """
         if option.parameters:
-            param_data = option.parameters[0].data
-            for param in option.parameters:
-                if param.active:
-                    param_data = param.data
-            option.apply(param_data)
+            param = next((param for param in option.parameters if param.active), option.parameters[0])
+            option.apply(param.data)
+            return
 
-        elif isinstance(option, Backend.ToggleOption):
-            option.apply(option.active)
+        handler = self._apply_dispatch.get(type(option))
+        if not handler:
+            for klass in type(option).__mro__:
+                if klass in self._apply_dispatch:
+                    handler = self._apply_dispatch[klass]
+                    self._apply_dispatch[type(option)] = handler
+                    break
 
-        elif isinstance(option, Backend.SliderOption):
-            option.apply(option.value)
+        if handler:
+            handler(option)
+
+    def _get_process_manager(self, serial):
+        """
+        Return a ProcessManager() for the device serial, reusing a previous
+        instance where possible.
+        """
+        try:
+            return self._procmgr_cache[serial]
+        except KeyError:
+            procmgr = procpid.ProcessManager(serial)
+            self._procmgr_cache[serial] = procmgr
+            return procmgr
+
+    def _get_software_state(self, serial):
+        """
+        Return a DeviceSoftwareState() for the device serial. The state file
+        is only re-read when it has changed on disk since the last use.
+        """
+        try:
+            cached_mtime, state = self._swstate_cache[serial]
+            if os.path.getmtime(state.state_path) == cached_mtime:
+                return state
+        except (KeyError, OSError):
+            pass
 
-        elif isinstance(option, (Backend.EffectOption, Backend.MultipleChoiceOption)):
-            option.apply()
+        state = procpid.DeviceSoftwareState(serial)
+        try:
+            mtime = os.path.getmtime(state.state_path)
+        except OSError:
+            mtime = -1
+        self._swstate_cache[serial] = (mtime, state)
+        return state
 
     def replay_active_effect(self, device):
         """
@@ -304,7 +427,7 @@ class Middleman(object):
         device.refresh()
 
         # Was the device playing a software effect?
-        state = procpid.DeviceSoftwareState(device.serial)
+        state = self._get_software_state(device.serial)
         effect = state.get_effect()
         if effect:
             procmgr = procpid.ProcessManager("helper")
@@ -327,6 +450,9 @@ class Middleman(object):
             hex_value   (str)   New #RRGGBB string
             colour_pos  (int)   (Optional) Position to append. 0 = Primary, 1 = Secondary, etc
         """
+        if option.colours[colour_pos] == hex_value:
+            return
+
         option.colours[colour_pos] = hex_value
         self._apply_option_with_same_params(option)
 
@@ -352,22 +478,50 @@ class Middleman(object):
             hex_value   (str)   New #RRGGBB string
             colour_pos  (int)   (Optional) Position to append. 0 = Primary, 1 = Secondary, etc
         """
+        self.set_colours_for_active_effect_device(device, {colour_pos: hex_value})
+
+    def set_colours_for_active_effect_device(self, device, colour_map):
+        """
+        Set multiple colour positions at once for all the device's active effects.
+
+        All colours for a zone are updated before its effect is re-applied,
+        so each zone incurs one hardware write regardless of how many
+        positions changed.
+
+        Params:
+            device      (obj)   Backend.DeviceItem() object
+            colour_map  (dict)  Positions mapping to new #RRGGBB strings,
+                                e.g. {0: "#00FF00", 1: "#FF0000"}
+        """
         for zone in device.zones:
             option = self.get_active_effect(zone)
-            if option:
-                self.set_colour_for_option(option, hex_value, colour_pos)
+            if not option:
+                continue
+
+            changed = False
+            for colour_pos, hex_value in colour_map.items():
+                if option.colours[colour_pos] != hex_value:
+                    option.colours[colour_pos] = hex_value
+                    changed = True
+
+            if changed:
+                self._apply_option_with_same_params(option)
 
     def stop_software_effect(self, serial):
         """
         Prior to applying a hardware effect, make sure any software effects
         have stopped.
         """
-        process = procpid.ProcessManager(serial)
-        state = procpid.DeviceSoftwareState(serial)
+        process = self._get_process_manager(serial)
+        state = self._get_software_state(serial)
+
+        # Capture both parts of the state up front, before clear_* mutates it.
+        effect = state.get_effect()
+        preset = state.get_preset()
 
-        if state.get_effect() or process.is_another_instance_is_running():
+        if effect or process.is_another_instance_is_running():
             process.stop()
             state.clear_effect()
 
-        if state.get_preset():
+        if preset:
             state.clear_preset()